@@ -5,17 +5,40 @@ import os
 import sys
 import json
 import re
-import glob
-import requests
-from requests.exceptions import RequestException
+import asyncio
+import aiohttp
 import time
-import markdown
 import argparse
 from pathlib import Path
 
 # GitHub APIのベースURL
 GITHUB_API_BASE = "https://api.github.com"
 
+# 同時アップロード数の既定値
+DEFAULT_CONCURRENCY = 8
+
+# Issue作成リクエストの1分あたりの上限の既定値
+# GitHubが文書化しているコンテンツ作成リクエストの上限（1分あたり80件）に合わせる
+DEFAULT_REQUESTS_PER_MINUTE = 80
+
+# レート制限に掛かった場合の最大リトライ回数と待機時間の上限（秒）
+MAX_RETRIES = 5
+MAX_BACKOFF = 60
+
+# Issueファイルの格納ディレクトリ
+ISSUES_DIR = "docs/issues"
+
+# タイトル・優先度・カテゴリはファイル先頭のヘッダー部分にのみ記載される
+HEADER_SCAN_SIZE = 8192
+
+# ヘッダー行をまとめて一度の走査で拾うための正規表現
+_HEADER_RE = re.compile(
+    r'^# Issue #(?P<number>\d+): (?P<title>.+)$'
+    r'|\*\*優先度\*\*: (?P<priority>.+)'
+    r'|\*\*カテゴリ\*\*: (?P<category>.+)',
+    re.MULTILINE
+)
+
 def get_github_token():
     """GitHub APIトークンを環境変数から取得"""
     token = os.environ.get("GITHUB_TOKEN")
@@ -31,27 +54,36 @@ def get_repo_info():
     repo = os.environ.get("GITHUB_REPO", "v8ui")
     return owner, repo
 
-def parse_issue_file(file_path):
-    """Issueファイルからタイトルと本文を解析"""
+def parse_issue_file(file_path, read_body=True):
+    """Issueファイルからタイトルと本文を解析
+
+    read_bodyがFalseの場合は残りの本文を読み込まず、ヘッダー部分のみを本文とする
+    （--dry-runでのプレビュー表示用）
+    """
     with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+        # 解析に必要なヘッダー部分だけを先に読み込む
+        head = f.read(HEADER_SCAN_SIZE)
+        content = head + f.read() if read_body else head
+
+    # ヘッダー部分を一度だけ走査し、各項目の最初の出現を採用
+    header = {}
+    for match in _HEADER_RE.finditer(head):
+        for key, value in match.groupdict().items():
+            if value is not None:
+                header.setdefault(key, value)
 
     # タイトルは最初の行から抽出（# Issue #NNN: Title形式）
-    title_match = re.search(r'^# Issue #(\d+): (.+)$', content, re.MULTILINE)
-    if not title_match:
+    if 'title' not in header:
         print(f"警告: {file_path}からタイトルを抽出できませんでした。")
         issue_number = Path(file_path).stem.split('_')[1]
         title = f"Issue #{issue_number}"
     else:
-        issue_number = title_match.group(1)
-        title = title_match.group(2)
+        issue_number = header['number']
+        title = header['title']
 
     # 優先度とカテゴリを抽出
-    priority_match = re.search(r'\*\*優先度\*\*: (.+)', content)
-    category_match = re.search(r'\*\*カテゴリ\*\*: (.+)', content)
-
-    priority = priority_match.group(1) if priority_match else "未設定"
-    category = category_match.group(1) if category_match else "未分類"
+    priority = header.get('priority', "未設定")
+    category = header.get('category', "未分類")
 
     # Markdownをそのまま本文として使用
     body = content
@@ -64,16 +96,71 @@ def parse_issue_file(file_path):
         "category": category
     }
 
-def create_github_issue(owner, repo, title, body, token, labels=None):
+def find_issue_files(issues_dir=ISSUES_DIR):
+    """issue_*.mdファイルを名前順に列挙"""
+    try:
+        with os.scandir(issues_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.startswith("issue_") and entry.name.endswith(".md")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+    return [entry.path for entry in sorted(entries, key=lambda e: e.name)]
+
+class RequestPacer:
+    """並行するリクエストの開始間隔を一定以上に保つ
+
+    レート制限の応答を受けた場合はpauseで全体の送信を止め、他のリクエストも待機させる
+    """
+
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.next_start = 0.0
+        self.paused_until = 0.0
+
+    async def wait(self):
+        """次のリクエストを送信できるまで待機"""
+        while True:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+            if start > now:
+                await asyncio.sleep(start - now)
+
+            # 待機中にレート制限を受けた場合は、解除後の順番を取り直す
+            if self.paused_until <= time.monotonic():
+                return
+
+    def pause(self, delay):
+        """delay秒後まで新しいリクエストの送信を止める"""
+        resume = time.monotonic() + delay
+        self.paused_until = max(self.paused_until, resume)
+        self.next_start = max(self.next_start, resume)
+
+def get_retry_delay(status, headers, attempt):
+    """レート制限の応答から再試行までの待機秒数を求める（レート制限でなければNone）"""
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return int(retry_after)
+
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = headers.get("X-RateLimit-Reset", "")
+        if reset.isdigit():
+            return max(1, int(reset) - int(time.time()))
+
+    # 403はレート制限を示すヘッダーがある場合のみ再試行する
+    if status == 429:
+        return min(MAX_BACKOFF, 2 ** attempt)
+
+    return None
+
+async def create_github_issue(session, owner, repo, title, body, labels=None, pacer=None):
     """GitHubにIssueを作成"""
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues"
 
-    # GitHubの推奨する認証方法に変更
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-
     data = {
         "title": title,
         "body": body
@@ -82,20 +169,79 @@ def create_github_issue(owner, repo, title, body, token, labels=None):
     if labels:
         data["labels"] = labels
 
-    try:
-        response = requests.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        return response.json()
-    except RequestException as e:
-        print(f"エラー: GitHubへのIssue作成中にエラーが発生しました: {e}")
-        if hasattr(e, 'response') and e.response:
-            print(f"ステータスコード: {e.response.status_code}")
-            print(f"レスポンス: {e.response.text}")
-        return None
+    for attempt in range(MAX_RETRIES + 1):
+        if pacer:
+            await pacer.wait()
+
+        try:
+            async with session.post(url, json=data) as response:
+                if response.status in (403, 429) and attempt < MAX_RETRIES:
+                    delay = get_retry_delay(response.status, response.headers, attempt)
+                    if delay is not None:
+                        print(f"レート制限: {delay}秒後に再試行します ({title})")
+                        if pacer:
+                            # 他のリクエストも同じだけ待機させる
+                            pacer.pause(delay)
+                        await asyncio.sleep(delay)
+                        continue
+
+                if response.status >= 400:
+                    print(f"エラー: GitHubへのIssue作成中にエラーが発生しました: {title}")
+                    print(f"ステータスコード: {response.status}")
+                    print(f"レスポンス: {await response.text()}")
+                    return None
+
+                return await response.json()
+        except aiohttp.ClientError as e:
+            print(f"エラー: GitHubへのIssue作成中にエラーが発生しました: {e}")
+            return None
+
+    return None
+
+async def upload_issues(issues, owner, repo, token, concurrency=DEFAULT_CONCURRENCY,
+                        requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE):
+    """Issueを並行してGitHubにアップロード"""
+    # GitHubの推奨する認証方法に変更
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json"
+    }
+
+    semaphore = asyncio.Semaphore(concurrency)
+    pacer = RequestPacer(requests_per_minute)
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+
+    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        async def upload(file_path, issue_data, labels):
+            async with semaphore:
+                result = await create_github_issue(
+                    session, owner, repo, issue_data['title'], issue_data['body'], labels, pacer
+                )
+
+            if result:
+                print(f"成功: Issue #{result['number']} を作成しました: {result['html_url']}")
+            else:
+                print(f"失敗: {file_path} のアップロードに失敗しました")
+
+        results = await asyncio.gather(
+            *(upload(*issue) for issue in issues),
+            return_exceptions=True
+        )
+
+    for (file_path, _, _), result in zip(issues, results):
+        if isinstance(result, Exception):
+            print(f"失敗: {file_path} のアップロードに失敗しました: {result}")
 
 def main():
     parser = argparse.ArgumentParser(description='GitHubにIssueをアップロード')
     parser.add_argument('--dry-run', action='store_true', help='実際にアップロードせずに内容を表示')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='同時にアップロードするIssueの数（1で逐次実行）')
+    parser.add_argument('--rate-limit', type=int, default=DEFAULT_REQUESTS_PER_MINUTE,
+                        help='1分あたりのIssue作成リクエストの上限（0で制限なし）。'
+                             f'既定値の{DEFAULT_REQUESTS_PER_MINUTE}はGitHubが文書化している'
+                             'コンテンツ作成リクエストの上限で、--concurrencyによる並行送信は'
+                             'この間隔の範囲内で行われる')
     args = parser.parse_args()
 
     # GitHubトークンとリポジトリ情報を取得
@@ -103,15 +249,16 @@ def main():
     owner, repo = get_repo_info()
 
     # issue_00X_*.mdファイルを検索
-    issue_files = sorted(glob.glob("docs/issues/issue_*.md"))
+    issue_files = find_issue_files()
 
     if not issue_files:
         print("アップロード対象のIssueファイルが見つかりませんでした。")
         sys.exit(1)
 
     # 各Issueファイルを処理
+    issues = []
     for file_path in issue_files:
-        issue_data = parse_issue_file(file_path)
+        issue_data = parse_issue_file(file_path, read_body=not args.dry_run)
         print(f"処理中: {file_path} -> {issue_data['title']}")
 
         # ラベルの設定
@@ -123,16 +270,13 @@ def main():
             print(f"  内容の先頭100文字: {issue_data['body'][:100]}...")
             print()
         else:
-            # GitHubにIssueを作成
-            result = create_github_issue(owner, repo, issue_data['title'], issue_data['body'], token, labels)
-
-            if result:
-                print(f"成功: Issue #{result['number']} を作成しました: {result['html_url']}")
-            else:
-                print(f"失敗: {file_path} のアップロードに失敗しました")
+            issues.append((file_path, issue_data, labels))
 
-            # API制限を避けるための小休止
-            time.sleep(1)
+    if issues:
+        # GitHubにIssueを作成（送信間隔を空け、レート制限の応答には応答ヘッダーに従って待機）
+        asyncio.run(upload_issues(
+            issues, owner, repo, token, max(1, args.concurrency), max(0, args.rate_limit)
+        ))
 
     print("すべてのIssueのアップロードが完了しました。")
 
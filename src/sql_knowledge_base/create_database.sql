@@ -66,16 +66,17 @@ CREATE TABLE validation_rules (
     example_fix TEXT,               -- 修正例
     context_requirements TEXT,      -- 適用コンテキスト（例: patcher, msp, jitter）
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(rule_type, pattern)
 );
 
 -- 自然言語意図からAPI関数へのマッピングテーブル
 CREATE TABLE api_mapping (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    natural_language_intent TEXT NOT NULL, -- 自然言語による意図（例: "メトロノームを作成する"）
-    min_devkit_function_id INTEGER,        -- 対応するMin-DevKit API関数ID
-    transformation_template TEXT,          -- 変換テンプレート
-    context_requirements TEXT,             -- コンテキスト要件
+    natural_language_intent TEXT NOT NULL UNIQUE, -- 自然言語による意図（例: "メトロノームを作成する"）
+    min_devkit_function_id INTEGER,               -- 対応するMin-DevKit API関数ID
+    transformation_template TEXT,                 -- 変換テンプレート
+    context_requirements TEXT,                    -- コンテキスト要件
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (min_devkit_function_id) REFERENCES min_devkit_api(id)
@@ -2,11 +2,25 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import csv
-import json
 import glob
 import re
+import mmap
+import heapq
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import NamedTuple
+
+# orjsonが利用可能であればJSONの検証に使用（どちらも解析エラーはValueErrorの派生）
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 # 基本設定
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,22 +33,240 @@ INPUT_FILES = sorted(glob.glob(os.path.join(CSV_DIR, 'MaxObjects*.csv')))
 # 出力ファイルパス
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, 'MaxObjects_fixed.csv')
 
+class MaxObject(NamedTuple):
+    """出力するオブジェクト情報の1行（生ファイルから抽出する際の列順でもある）"""
+    name: str
+    description: str = ''
+    category: str = ''
+    version_compatibility: str = ''
+    inlets: str = '[]'
+    outlets: str = '[]'
+    is_ui_object: str = '0'
+    is_deprecated: str = '0'
+    alternative: str = ''
+
+# 出力するオブジェクト情報のフィールド
+OBJECT_FIELDS = list(MaxObject._fields)
+
+# ファイル読み書き時のバッファサイズ（既定の8KiBではシステムコールが多くなるため）
+IO_BUFFER_SIZE = 1 << 20
+
+# 入力ファイルの合計サイズがこれ未満なら、プロセスの起動コストの方が大きいため並列化しない
+PARALLEL_MIN_INPUT_SIZE = 4 << 20
+
+# 生ファイルから行全体を検出するための正規表現パターン
+# 各行は "name,description,..." のように始まる
+# 入出力情報の探索は同じ行の中に限定し、マッチ失敗時にファイル末尾まで
+# 後戻り探索しないようにしている（JSON内の ']' は許容する）
+_ROW_RE = re.compile(
+    r'([^,\n]+),([^,\n]*),([^,\n]*),([^,\n]*),(\[[^\n]*?\]),(\[[^\n]*?\]),([01]),([01]),([^\n]*)'
+)
+
+# _ROW_REのバイト列版（メモリマップした生ファイルを直接走査する）
+# 改行コードを変換せずに読むため、\r も行区切りとして扱う
+_RAW_ROW_RE = re.compile(
+    rb'([^,\r\n]+),([^,\r\n]*),([^,\r\n]*),([^,\r\n]*),(\[[^\r\n]*?\]),(\[[^\r\n]*?\]),([01]),([01]),([^\r\n]*)'
+)
+
+# 崩れた生ファイルからオブジェクト名と入出力情報だけを拾うための正規表現パターン
+_OBJ_RE = re.compile(rb'([a-zA-Z0-9_.~]+),[^[]*(\[[^]]*\]),[^[]*(\[[^]]*\]),[01],[01]')
+
+# 生ファイルの行区切り
+_LINE_END_RE = re.compile(rb'\r\n?|\n')
+
+# 真として扱うboolean値の表記（lower()による一時文字列を作らずに判定する）
+_TRUEVALS = frozenset(('1', 'true', 'True', 'TRUE', 'yes', 'Yes', 'YES', 'y', 'Y'))
+
+# 多数の行で同じ値が繰り返されるため、intern して文字列を共有するフィールド
+_INTERNED_FIELDS = ('name', 'category', 'version_compatibility')
+
+@lru_cache(maxsize=None)
 def clean_json_field(field):
-    """JSONフィールドを正しい形式に修正"""
+    """JSONフィールドを正しい形式に修正
+
+    inlets/outletsの値は同じ文字列が繰り返し現れるため、検証結果をキャッシュする
+    """
     if not field:
         return '[]'
 
     # 既にJSON形式であれば、そのまま返す
     if field.startswith('[') and field.endswith(']'):
         try:
-            json.loads(field)
+            _loads(field)
             return field
-        except:
+        except ValueError:
             pass  # JSONとして解析できない場合は続行
 
     # フィールドを修正して返す
     return '[]'
 
+@contextmanager
+def map_raw_file(file_path):
+    """生ファイルを読み取り専用でメモリマップする
+
+    (バッファ, ヘッダー行を除いた本文の開始位置) を返す。
+    空のファイルはmmapできないため、空のバイト列を返す。
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b'', 0
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # CSVヘッダー行をスキップ
+            start = 0
+            if mm[:5] == b'name,':
+                line_end = _LINE_END_RE.search(mm)
+                start = line_end.end() if line_end else len(mm)
+
+            yield mm, start
+
+def decode_raw_field(value):
+    """生ファイルから切り出したバイト列を文字列に戻す（改行は \\n に統一）"""
+    text = value.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def object_from_raw_match(match):
+    """_ROW_REのマッチ結果からオブジェクト情報を組み立てる"""
+    (name, description, category, version_compatibility,
+     inlets, outlets, is_ui_object, is_deprecated, alternative) = map(str.strip, match)
+
+    return MaxObject(
+        sys.intern(name),
+        description,
+        sys.intern(category),
+        sys.intern(version_compatibility),
+        # JSONフィールドの検証
+        clean_json_field(inlets),
+        clean_json_field(outlets),
+        is_ui_object,
+        is_deprecated,
+        alternative
+    )
+
+def merge_sorted_objects(file_objects, name_index=0):
+    """ファイルごとに名前順でソートされた行を統合し、重複する名前を除く
+
+    heapq.mergeは安定なので、同名の行は先に処理したファイルのものが残る
+    """
+    last_name = None
+    for row in heapq.merge(*file_objects, key=itemgetter(name_index)):
+        if row[name_index] != last_name:
+            last_name = row[name_index]
+            yield row
+
+def map_input_files(func, *args):
+    """INPUT_FILESの各ファイルにfunc(ファイルパス, *args)を適用し、結果をファイル順のリストで返す
+
+    ファイルごとの解析は互いに独立しているため、入力が大きく複数のCPUを使える場合に限り
+    別プロセスで並列に処理する（通常の数百行程度の入力では同じプロセスで順に処理する）
+    """
+    for input_file in INPUT_FILES:
+        print(f"  処理中: {os.path.basename(input_file)}")
+
+    iterables = [INPUT_FILES] + [itertools.repeat(arg) for arg in args]
+    max_workers = min(len(INPUT_FILES), os.cpu_count() or 1)
+    if max_workers < 2 or sum(map(os.path.getsize, INPUT_FILES)) < PARALLEL_MIN_INPUT_SIZE:
+        return list(map(func, *iterables))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *iterables))
+
+def write_output_csv(fields, rows):
+    """ヘッダーと行データ（フィールド順のシーケンス）を出力ファイルに書き出し、行数を返す"""
+    counter = itertools.count()
+    with open(OUTPUT_FILE, 'w', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        # 行は逐次書き出し、書き出した数だけを数える
+        writer.writerows(row for row, _ in zip(rows, counter))
+    return next(counter)
+
+def read_csv_header(input_file):
+    """CSVファイルのヘッダー行を返す（空のファイルならNone）"""
+    with open(input_file, 'r', encoding='utf-8', newline='') as f:
+        return next(csv.reader(f), None)
+
+def fix_csv_file(input_file, header_fields):
+    """1つのCSVファイルを修正し、ヘッダーの列順の行を名前順にソートして返す
+
+    ファイルは一度だけ読み込み、CSVとして解析できなかった行は
+    同じパスの中で正規表現による復元を試みる
+    """
+    with open(input_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+        lines = f.readlines()
+
+    # 解析できなかった行の元テキストを取り出せるよう、行リストから読み込む
+    csv_reader = csv.reader(lines)
+
+    # ヘッダー行はスキップ（列構成は最初のファイルのヘッダーに従う）
+    if next(csv_reader, None) is None:
+        return []  # 空のファイル
+
+    name_index = header_fields.index('name')
+    num_fields = len(header_fields)
+
+    # 補正対象の列位置
+    json_indexes = [i for i, field in enumerate(header_fields) if field in ('inlets', 'outlets')]
+    bool_indexes = [i for i, field in enumerate(header_fields) if field in ('is_ui_object', 'is_deprecated')]
+    intern_indexes = [i for i, field in enumerate(header_fields) if field in _INTERNED_FIELDS]
+
+    # 復元した行（MaxObject）の値をヘッダーの列順に並べ替えるための対応表
+    recovered_getters = [
+        itemgetter(OBJECT_FIELDS.index(field)) if field in OBJECT_FIELDS else None
+        for field in header_fields
+    ]
+
+    objects = {}
+    rejected_lines = []
+
+    # 各行を処理
+    line_start = csv_reader.line_num
+    for row in csv_reader:
+        row_lines = slice(line_start, csv_reader.line_num)
+        line_start = csv_reader.line_num
+
+        # 行が空の場合はスキップ
+        if not row:
+            continue
+
+        # 列数が足りない行は後で正規表現による復元を試みる
+        if len(row) < num_fields:
+            rejected_lines.extend(lines[row_lines])
+            continue
+
+        # 重複行は値を組み立てる前に名前だけで判定する
+        name = sys.intern(row[name_index].strip())
+        if not name or name in objects:
+            continue
+
+        # 行からオブジェクト情報を抽出（ヘッダーの列数分だけ空白を除去）
+        values = list(itertools.islice(map(str.strip, row), num_fields))
+
+        # JSONフィールドの修正
+        for i in json_indexes:
+            values[i] = clean_json_field(values[i])
+
+        # boolean値の修正
+        for i in bool_indexes:
+            values[i] = '1' if values[i] in _TRUEVALS else '0'
+
+        for i in intern_indexes:
+            values[i] = sys.intern(values[i])
+
+        objects[name] = tuple(values)
+
+    # CSVとして崩れていた行から、行全体のパターンで復元できるものを拾う
+    for match in _ROW_RE.findall(''.join(rejected_lines)):
+        name = sys.intern(match[0].strip())
+        if name and name not in objects:
+            obj = object_from_raw_match(match)
+            objects[name] = tuple(get(obj) if get else '' for get in recovered_getters)
+
+    return [objects[name] for name in sorted(objects)]
+
 def fix_maxobjects_csv():
     """MaxObjectsのCSVファイルを修正して一つのファイルにまとめる"""
     print(f"MaxObjectsのCSVファイルを修正しています...")
@@ -42,62 +274,41 @@ def fix_maxobjects_csv():
     # 出力ディレクトリが存在しない場合は作成
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # 各ファイルからオブジェクト情報を抽出
-    all_objects = {}
-    header_fields = None
-
-    # 各ファイルを処理
-    for input_file in INPUT_FILES:
-        print(f"  処理中: {os.path.basename(input_file)}")
+    # 列構成は最初の空でないファイルのヘッダーに従う
+    header_fields = next(filter(None, map(read_csv_header, INPUT_FILES)), None)
+    if header_fields is None:
+        # ヘッダーのある入力がなければ、標準の列構成でヘッダーのみのファイルを出力する
+        print(f"  警告: ヘッダーを持つMaxObjectsのCSVファイルが見つかりません: {CSV_DIR}")
+        header_fields = OBJECT_FIELDS
+
+    # 各ファイルから名前順にソートしたオブジェクト情報を抽出
+    # name列がなければ有効なオブジェクトは存在しない
+    if 'name' in header_fields:
+        name_index = header_fields.index('name')
+        file_objects = map_input_files(fix_csv_file, header_fields)
+    else:
+        name_index = 0
+        file_objects = []
+
+    # 修正したデータを名前順に統合しながら書き出し
+    count = write_output_csv(header_fields, merge_sorted_objects(file_objects, name_index))
+
+    print(f"修正完了。{count}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
+    return OUTPUT_FILE
 
-        with open(input_file, 'r', encoding='utf-8') as f:
-            csv_reader = csv.reader(f)
-
-            # ヘッダー行を取得
-            try:
-                if header_fields is None:
-                    header_fields = next(csv_reader)
-                else:
-                    next(csv_reader)  # 既にヘッダーがある場合はスキップ
-            except StopIteration:
-                continue  # 空のファイル
-
-            # 各行を処理
-            for row in csv_reader:
-                # 行が空の場合はスキップ
-                if not row or len(row) < len(header_fields):
-                    continue
-
-                # 行からオブジェクト情報を抽出
-                obj = {}
-                for i, field in enumerate(header_fields):
-                    if i < len(row):
-                        obj[field] = row[i].strip()
-
-                # オブジェクト名が有効な場合のみ追加
-                name = obj.get('name', '').strip()
-                if name and name not in all_objects:
-                    # JSONフィールドの修正
-                    for field in ['inlets', 'outlets']:
-                        obj[field] = clean_json_field(obj.get(field, ''))
-
-                    # boolean値の修正
-                    for field in ['is_ui_object', 'is_deprecated']:
-                        obj[field] = '1' if obj.get(field, '').lower() in ('1', 'true', 'yes') else '0'
-
-                    all_objects[name] = obj
-
-    # 修正したデータを書き出し
-    with open(OUTPUT_FILE, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=header_fields)
-        writer.writeheader()
+def extract_raw_file(input_file):
+    """1つの生ファイルからオブジェクト情報を抽出し、名前順にソートして返す"""
+    objects = {}
 
-        # 名前でソートしてから書き出し
-        for name in sorted(all_objects.keys()):
-            writer.writerow(all_objects[name])
+    # ファイル全体を文字列として読み込まず、マップしたバッファを直接走査する
+    with map_raw_file(input_file) as (content, start):
+        for match in _RAW_ROW_RE.finditer(content, start):
+            # 名前だけを先にデコードし、重複行の残りのフィールドはデコードしない
+            name = sys.intern(decode_raw_field(match[1]).strip())
+            if name and name not in objects:
+                objects[name] = object_from_raw_match([decode_raw_field(v) for v in match.groups()])
 
-    print(f"修正完了。{len(all_objects)}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
-    return OUTPUT_FILE
+    return [objects[name] for name in sorted(objects)]
 
 def extract_objects_from_raw_files():
     """生のファイルから直接オブジェクト情報を抽出"""
@@ -106,59 +317,31 @@ def extract_objects_from_raw_files():
     # 出力ディレクトリが存在しない場合は作成
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # 必要なフィールド
-    fields = ['name', 'description', 'category', 'version_compatibility',
-              'inlets', 'outlets', 'is_ui_object', 'is_deprecated', 'alternative']
-
-    # 各ファイルからオブジェクト情報を抽出
-    all_objects = {}
-
-    for input_file in INPUT_FILES:
-        print(f"  処理中: {os.path.basename(input_file)}")
+    # 各ファイルから名前順にソートしたオブジェクト情報を抽出
+    file_objects = map_input_files(extract_raw_file)
 
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # 修正したデータを名前順に統合しながら書き出し
+    count = write_output_csv(OBJECT_FIELDS, merge_sorted_objects(file_objects))
 
-            # 行区切りを統一
-            content = content.replace('\r\n', '\n').replace('\r', '\n')
+    print(f"抽出完了。{count}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
+    return OUTPUT_FILE
 
-            # CSVヘッダー行をスキップ
-            if content.startswith('name,'):
-                content = '\n'.join(content.split('\n')[1:])
-
-            # 行全体を検出するための正規表現パターン
-            # 各行は "name,description,..." のように始まる
-            pattern = r'([^,\n]+),([^,\n]*),([^,\n]*),([^,\n]*),(\[.*?\]),(\[.*?\]),([01]),([01]),([^\n]*)'
-            matches = re.findall(pattern, content, re.DOTALL)
-
-            for match in matches:
-                name = match[0].strip()
-                if name and name not in all_objects:
-                    obj = {}
-                    for i, field in enumerate(fields):
-                        obj[field] = match[i].strip() if i < len(match) else ''
-
-                    # JSONフィールドの検証
-                    for field in ['inlets', 'outlets']:
-                        if field in obj:
-                            try:
-                                json.loads(obj[field])
-                            except:
-                                obj[field] = '[]'
-
-                    all_objects[name] = obj
-
-    # 修正したデータを書き出し
-    with open(OUTPUT_FILE, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
+def scan_raw_file_names(input_file):
+    """1つの生ファイルからオブジェクト名だけを拾い、既定値のオブジェクト情報を名前順に返す"""
+    objects = {}
 
-        # 名前でソートしてから書き出し
-        for name in sorted(all_objects.keys()):
-            writer.writerow(all_objects[name])
+    # マップしたバッファを直接走査する（改行はパターン側で吸収される）
+    with map_raw_file(input_file) as (content, start):
+        # オブジェクト情報を抽出
+        # 各オブジェクト情報は "name,..." で始まる
+        for match in _OBJ_RE.finditer(content, start):
+            # 使うのは名前だけなので、名前以外はデコードしない
+            name = sys.intern(match[1].decode('utf-8').strip())
+            if name and name not in objects:
+                # 説明やカテゴリは抽出が難しいので既定値（空）のままにする
+                objects[name] = MaxObject(name)
 
-    print(f"抽出完了。{len(all_objects)}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
-    return OUTPUT_FILE
+    return [objects[name] for name in sorted(objects)]
 
 def process_raw_files_directly():
     """生のファイルを直接処理し、必要な情報を取得"""
@@ -167,59 +350,251 @@ def process_raw_files_directly():
     # 出力ディレクトリが存在しない場合は作成
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # 固定フィールド定義
-    fields = ['name', 'description', 'category', 'version_compatibility',
-              'inlets', 'outlets', 'is_ui_object', 'is_deprecated', 'alternative']
+    # 各ファイルから名前順にソートしたオブジェクト情報を抽出
+    file_objects = map_input_files(scan_raw_file_names)
 
-    # 各ファイルからオブジェクト情報を抽出
-    all_objects = {}
+    # 修正したデータを名前順に統合しながら書き出し
+    count = write_output_csv(OBJECT_FIELDS, merge_sorted_objects(file_objects))
 
-    for input_file in INPUT_FILES:
-        print(f"  処理中: {os.path.basename(input_file)}")
-
-        with open(input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-            # 最初の行がヘッダーなのでスキップ
-            if lines and lines[0].startswith('name,'):
-                lines = lines[1:]
-
-            # 各行を結合して処理
-            content = ' '.join([line.strip() for line in lines])
-
-            # オブジェクト情報を抽出
-            # 各オブジェクト情報は "name,..." で始まる
-            objects_raw = re.findall(r'([a-zA-Z0-9_.~]+),[^[]*(\[[^]]*\]),[^[]*(\[[^]]*\]),[01],[01]', content)
-
-            for obj_data in objects_raw:
-                name = obj_data[0].strip()
-                if name and name not in all_objects:
-                    obj = {
-                        'name': name,
-                        'description': '',  # 説明は抽出が難しいのでここでは空にする
-                        'category': '',     # カテゴリも抽出が難しいのでここでは空にする
-                        'version_compatibility': '',
-                        'inlets': '[]',
-                        'outlets': '[]',
-                        'is_ui_object': '0',
-                        'is_deprecated': '0',
-                        'alternative': ''
-                    }
-
-                    all_objects[name] = obj
-
-    # 修正したデータを書き出し
-    with open(OUTPUT_FILE, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-
-        # 名前でソートしてから書き出し
-        for name in sorted(all_objects.keys()):
-            writer.writerow(all_objects[name])
-
-    print(f"処理完了。{len(all_objects)}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
+    print(f"処理完了。{count}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
     return OUTPUT_FILE
 
+# 主要なMax/MSPオブジェクトのリスト（名前, カテゴリ, UIオブジェクトかどうか）
+_MANUAL_OBJECTS = [
+    # Audio Objects
+    ('cycle~', 'audio/gen', '0'),
+    ('gain~', 'audio', '0'),
+    ('live.gain~', 'audio/ui', '1'),
+    ('meter~', 'audio/ui', '1'),
+    ('adc~', 'audio/io', '0'),
+    ('dac~', 'audio/io', '0'),
+    ('biquad~', 'audio/filter', '0'),
+    ('buffer~', 'audio/buffer', '0'),
+    ('delay~', 'audio/delay', '0'),
+    ('phasor~', 'audio/gen', '0'),
+    ('noise~', 'audio/gen', '0'),
+    ('line~', 'audio/control', '0'),
+    ('*~', 'audio/math', '0'),
+    ('+~', 'audio/math', '0'),
+    ('-~', 'audio/math', '0'),
+    ('groove~', 'audio/playback', '0'),
+    ('play~', 'audio/playback', '0'),
+    ('record~', 'audio/recording', '0'),
+    ('sfplay~', 'audio/playback', '0'),
+    ('sfrecord~', 'audio/recording', '0'),
+    ('adsr~', 'audio/control', '0'),
+    ('avg~', 'audio/analysis', '0'),
+    ('clip~', 'audio/fx', '0'),
+    ('click~', 'audio/gen', '0'),
+    ('count~', 'audio/control', '0'),
+    ('curve~', 'audio/control', '0'),
+    ('downsamp~', 'audio/resample', '0'),
+    ('edge~', 'audio/analysis', '0'),
+    ('env~', 'audio/analysis', '0'),
+    ('fftin~', 'audio/fft', '0'),
+    ('fftout~', 'audio/fft', '0'),
+    ('filter~', 'audio/filter', '0'),
+    ('gate~', 'audio/control', '0'),
+    ('hip~', 'audio/filter', '0'),
+    ('lop~', 'audio/filter', '0'),
+    ('lores~', 'audio/filter', '0'),
+    ('mtof~', 'audio/conversion', '0'),
+    ('ftom~', 'audio/conversion', '0'),
+    ('onepole~', 'audio/filter', '0'),
+    ('pan2~', 'audio/spatial', '0'),
+    ('pan~', 'audio/spatial', '0'),
+    ('peak~', 'audio/analysis', '0'),
+    ('pfft~', 'audio/fft', '0'),
+    ('pink~', 'audio/gen', '0'),
+    ('rampsmooth~', 'audio/filter', '0'),
+    ('rect~', 'audio/gen', '0'),
+    ('reson~', 'audio/filter', '0'),
+    ('sah~', 'audio/sampling', '0'),
+    ('saw~', 'audio/gen', '0'),
+    ('selector~', 'audio/control', '0'),
+    ('slide~', 'audio/filter', '0'),
+    ('snapshot~', 'audio/control', '0'),
+    ('spike~', 'audio/analysis', '0'),
+    ('svf~', 'audio/filter', '0'),
+    ('tanh~', 'audio/distortion', '0'),
+    ('teeth~', 'audio/filter', '0'),
+    ('trapezoid~', 'audio/gen', '0'),
+    ('zerox~', 'audio/analysis', '0'),
+
+    # MSP Objects
+    ('poly~', 'msp', '0'),
+    ('gen~', 'msp/gen', '0'),
+    ('mc.pack~', 'msp/mc', '0'),
+    ('mc.unpack~', 'msp/mc', '0'),
+    ('mc.mix~', 'msp/mc', '0'),
+    ('mc.op~', 'msp/mc', '0'),
+    ('mc.selector~', 'msp/mc', '0'),
+
+    # UI Objects
+    ('button', 'ui', '1'),
+    ('toggle', 'ui', '1'),
+    ('slider', 'ui', '1'),
+    ('dial', 'ui', '1'),
+    ('live.dial', 'ui', '1'),
+    ('number', 'ui/data', '1'),
+    ('flonum', 'ui/data', '1'),
+    ('message', 'ui/messaging', '1'),
+    ('comment', 'ui', '1'),
+    ('multislider', 'ui', '1'),
+    ('umenu', 'ui', '1'),
+    ('live.menu', 'ui', '1'),
+    ('live.text', 'ui', '1'),
+    ('live.numbox', 'ui/data', '1'),
+    ('live.slider', 'ui', '1'),
+    ('live.step', 'ui/sequencer', '1'),
+    ('live.tab', 'ui', '1'),
+    ('live.toggle', 'ui', '1'),
+    ('live.button', 'ui', '1'),
+    ('kslider', 'ui/midi', '1'),
+    ('matrixctrl', 'ui', '1'),
+    ('spectroscope~', 'ui/audio', '1'),
+    ('scope~', 'ui/audio', '1'),
+    ('panel', 'ui', '1'),
+    ('rslider', 'ui', '1'),
+    ('textedit', 'ui/text', '1'),
+    ('waveform~', 'ui/audio', '1'),
+    ('attrui', 'ui/attributes', '1'),
+    ('pictslider', 'ui', '1'),
+    ('preset', 'ui/storage', '1'),
+
+    # Control Objects
+    ('metro', 'timing', '0'),
+    ('counter', 'math', '0'),
+    ('random', 'math', '0'),
+    ('scale', 'math', '0'),
+    ('select', 'control', '0'),
+    ('route', 'control', '0'),
+    ('pack', 'control', '0'),
+    ('unpack', 'control', '0'),
+    ('trigger', 'control', '0'),
+    ('zl', 'list', '0'),
+    ('coll', 'data', '0'),
+    ('dict', 'data', '0'),
+    ('sprintf', 'text', '0'),
+    ('print', 'debug', '0'),
+    ('timer', 'timing', '0'),
+    ('delay', 'timing', '0'),
+    ('pipe', 'timing', '0'),
+    ('defer', 'timing', '0'),
+    ('line', 'control', '0'),
+    ('regexp', 'text', '0'),
+    ('bach.score', 'music/notation', '1'),
+    ('bach.roll', 'music/notation', '1'),
+    ('bucket', 'data', '0'),
+    ('buddy', 'control', '0'),
+    ('capture', 'data', '0'),
+    ('change', 'control', '0'),
+    ('clocker', 'timing', '0'),
+    ('drunk', 'math', '0'),
+    ('filewatch', 'system', '0'),
+    ('follow', 'timing', '0'),
+    ('fromsymbol', 'conversion', '0'),
+    ('funbuff', 'data', '0'),
+    ('funnel', 'list', '0'),
+    ('gate', 'control', '0'),
+    ('iter', 'list', '0'),
+    ('join', 'list', '0'),
+    ('key', 'input', '0'),
+    ('keyup', 'input', '0'),
+    ('match', 'control', '0'),
+    ('pattrstorage', 'attributes', '0'),
+    ('prepend', 'control', '0'),
+    ('spray', 'control', '0'),
+    ('stripnote', 'midi', '0'),
+    ('tosymbol', 'conversion', '0'),
+    ('uzi', 'control', '0'),
+    ('value', 'data', '0'),
+
+    # Jitter Objects
+    ('jit.matrix', 'jitter/data', '0'),
+    ('jit.window', 'jitter/ui', '1'),
+    ('jit.pwindow', 'jitter/ui', '1'),
+    ('jit.gl.render', 'jitter/gl', '0'),
+    ('jit.gl.mesh', 'jitter/gl', '0'),
+    ('jit.op', 'jitter/math', '0'),
+    ('jit.gl.videoplane', 'jitter/gl', '0'),
+    ('jit.gl.gridshape', 'jitter/gl', '0'),
+    ('jit.gl.shader', 'jitter/gl', '0'),
+    ('jit.gl.texture', 'jitter/gl', '0'),
+    ('jit.grab', 'jitter/input', '0'),
+    ('jit.movie', 'jitter/video', '0'),
+    ('jit.qt.movie', 'jitter/video', '0'),
+    ('jit.noise', 'jitter/gen', '0'),
+    ('jit.record', 'jitter/output', '0'),
+    ('jit.qt.record', 'jitter/output', '0'),
+    ('jit.brcosa', 'jitter/fx', '0'),
+    ('jit.char2float', 'jitter/conversion', '0'),
+    ('jit.concat', 'jitter/data', '0'),
+    ('jit.dimmap', 'jitter/data', '0'),
+    ('jit.fill', 'jitter/data', '0'),
+    ('jit.gen', 'jitter/gen', '0'),
+    ('jit.gl.sketch', 'jitter/gl', '0'),
+    ('jit.gl.text2d', 'jitter/gl', '0'),
+    ('jit.gl.text3d', 'jitter/gl', '0'),
+    ('jit.phys.body', 'jitter/physics', '0'),
+    ('jit.phys.world', 'jitter/physics', '0'),
+
+    # MIDI Objects
+    ('noteout', 'midi', '0'),
+    ('notein', 'midi', '0'),
+    ('midiout', 'midi', '0'),
+    ('midiin', 'midi', '0'),
+    ('ctlin', 'midi', '0'),
+    ('ctlout', 'midi', '0'),
+    ('pgmin', 'midi', '0'),
+    ('pgmout', 'midi', '0'),
+    ('bendout', 'midi', '0'),
+    ('bendin', 'midi', '0'),
+    ('touchout', 'midi', '0'),
+    ('touchin', 'midi', '0'),
+    ('makenote', 'midi', '0'),
+    ('midiparse', 'midi', '0'),
+    ('midiformat', 'midi', '0'),
+
+    # Min Objects
+    ('min.buffer.loop~', 'min/audio', '0'),
+    ('min.edge~', 'min/audio', '0'),
+    ('min.beat.pattern', 'min/midi', '0'),
+    ('min.note.make', 'min/midi', '0'),
+    ('min.threadcheck', 'min/debug', '0'),
+    ('min.buffer.index~', 'min/audio', '0'),
+    ('min.environment', 'min/system', '0'),
+    ('min.hello-world', 'min/example', '0'),
+    ('min.jit.stencil', 'min/jitter', '0'),
+    ('min.meter~', 'min/audio', '0'),
+    ('min.phasor~', 'min/audio', '0'),
+    ('min.pan~', 'min/audio', '0'),
+    ('min.dict.join', 'min/data', '0'),
+    ('min.project', 'min/system', '0'),
+    ('min.prefs', 'min/system', '0'),
+    ('min.remote', 'min/control', '0'),
+    ('min.sift~', 'min/audio', '0'),
+    ('min.xfade~', 'min/audio', '0'),
+    ('min.patcher.control', 'min/control', '0'),
+    ('min.info~', 'min/audio', '0'),
+    ('mc.min.info~', 'min/audio', '0'),
+]
+
+# 手動リストの出力行（名前順にソート済み）
+_MANUAL_ROWS = sorted(
+    [
+        MaxObject(name, f"{name} オブジェクト", category, 'Max 8.0+', is_ui_object=is_ui_object)
+        for name, category, is_ui_object in _MANUAL_OBJECTS
+    ],
+    key=itemgetter(0)
+)
+
+# 手動リストの値はCSVのクォートが不要なものに限り、csvモジュールを通さずに書き出す
+assert not any(
+    char in value
+    for row in _MANUAL_ROWS for value in row for char in (',', '"', '\r', '\n')
+), "手動リストの値にクォートが必要な文字が含まれています"
+
 def create_manual_list():
     """Max/MSPオブジェクトの手動リストを作成"""
     print("Max/MSPオブジェクトの手動リストを作成しています...")
@@ -227,258 +602,20 @@ def create_manual_list():
     # 出力ディレクトリが存在しない場合は作成
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # 主要なMax/MSPオブジェクトのリスト
-    max_objects = [
-        # Audio Objects
-        {'name': 'cycle~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'gain~', 'category': 'audio', 'is_ui_object': '0'},
-        {'name': 'live.gain~', 'category': 'audio/ui', 'is_ui_object': '1'},
-        {'name': 'meter~', 'category': 'audio/ui', 'is_ui_object': '1'},
-        {'name': 'adc~', 'category': 'audio/io', 'is_ui_object': '0'},
-        {'name': 'dac~', 'category': 'audio/io', 'is_ui_object': '0'},
-        {'name': 'biquad~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'buffer~', 'category': 'audio/buffer', 'is_ui_object': '0'},
-        {'name': 'delay~', 'category': 'audio/delay', 'is_ui_object': '0'},
-        {'name': 'phasor~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'noise~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'line~', 'category': 'audio/control', 'is_ui_object': '0'},
-        {'name': '*~', 'category': 'audio/math', 'is_ui_object': '0'},
-        {'name': '+~', 'category': 'audio/math', 'is_ui_object': '0'},
-        {'name': '-~', 'category': 'audio/math', 'is_ui_object': '0'},
-        {'name': 'groove~', 'category': 'audio/playback', 'is_ui_object': '0'},
-        {'name': 'play~', 'category': 'audio/playback', 'is_ui_object': '0'},
-        {'name': 'record~', 'category': 'audio/recording', 'is_ui_object': '0'},
-        {'name': 'sfplay~', 'category': 'audio/playback', 'is_ui_object': '0'},
-        {'name': 'sfrecord~', 'category': 'audio/recording', 'is_ui_object': '0'},
-        {'name': 'adsr~', 'category': 'audio/control', 'is_ui_object': '0'},
-        {'name': 'avg~', 'category': 'audio/analysis', 'is_ui_object': '0'},
-        {'name': 'clip~', 'category': 'audio/fx', 'is_ui_object': '0'},
-        {'name': 'click~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'count~', 'category': 'audio/control', 'is_ui_object': '0'},
-        {'name': 'curve~', 'category': 'audio/control', 'is_ui_object': '0'},
-        {'name': 'downsamp~', 'category': 'audio/resample', 'is_ui_object': '0'},
-        {'name': 'edge~', 'category': 'audio/analysis', 'is_ui_object': '0'},
-        {'name': 'env~', 'category': 'audio/analysis', 'is_ui_object': '0'},
-        {'name': 'fftin~', 'category': 'audio/fft', 'is_ui_object': '0'},
-        {'name': 'fftout~', 'category': 'audio/fft', 'is_ui_object': '0'},
-        {'name': 'filter~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'gate~', 'category': 'audio/control', 'is_ui_object': '0'},
-        {'name': 'hip~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'lop~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'lores~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'mtof~', 'category': 'audio/conversion', 'is_ui_object': '0'},
-        {'name': 'ftom~', 'category': 'audio/conversion', 'is_ui_object': '0'},
-        {'name': 'onepole~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'pan2~', 'category': 'audio/spatial', 'is_ui_object': '0'},
-        {'name': 'pan~', 'category': 'audio/spatial', 'is_ui_object': '0'},
-        {'name': 'peak~', 'category': 'audio/analysis', 'is_ui_object': '0'},
-        {'name': 'pfft~', 'category': 'audio/fft', 'is_ui_object': '0'},
-        {'name': 'pink~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'rampsmooth~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'rect~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'reson~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'sah~', 'category': 'audio/sampling', 'is_ui_object': '0'},
-        {'name': 'saw~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'selector~', 'category': 'audio/control', 'is_ui_object': '0'},
-        {'name': 'slide~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'snapshot~', 'category': 'audio/control', 'is_ui_object': '0'},
-        {'name': 'spike~', 'category': 'audio/analysis', 'is_ui_object': '0'},
-        {'name': 'svf~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'tanh~', 'category': 'audio/distortion', 'is_ui_object': '0'},
-        {'name': 'teeth~', 'category': 'audio/filter', 'is_ui_object': '0'},
-        {'name': 'trapezoid~', 'category': 'audio/gen', 'is_ui_object': '0'},
-        {'name': 'zerox~', 'category': 'audio/analysis', 'is_ui_object': '0'},
-
-        # MSP Objects
-        {'name': 'poly~', 'category': 'msp', 'is_ui_object': '0'},
-        {'name': 'gen~', 'category': 'msp/gen', 'is_ui_object': '0'},
-        {'name': 'mc.pack~', 'category': 'msp/mc', 'is_ui_object': '0'},
-        {'name': 'mc.unpack~', 'category': 'msp/mc', 'is_ui_object': '0'},
-        {'name': 'mc.mix~', 'category': 'msp/mc', 'is_ui_object': '0'},
-        {'name': 'mc.op~', 'category': 'msp/mc', 'is_ui_object': '0'},
-        {'name': 'mc.selector~', 'category': 'msp/mc', 'is_ui_object': '0'},
-
-        # UI Objects
-        {'name': 'button', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'toggle', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'slider', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'dial', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'live.dial', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'number', 'category': 'ui/data', 'is_ui_object': '1'},
-        {'name': 'flonum', 'category': 'ui/data', 'is_ui_object': '1'},
-        {'name': 'message', 'category': 'ui/messaging', 'is_ui_object': '1'},
-        {'name': 'comment', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'multislider', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'umenu', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'live.menu', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'live.text', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'live.numbox', 'category': 'ui/data', 'is_ui_object': '1'},
-        {'name': 'live.slider', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'live.step', 'category': 'ui/sequencer', 'is_ui_object': '1'},
-        {'name': 'live.tab', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'live.toggle', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'live.button', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'kslider', 'category': 'ui/midi', 'is_ui_object': '1'},
-        {'name': 'matrixctrl', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'spectroscope~', 'category': 'ui/audio', 'is_ui_object': '1'},
-        {'name': 'scope~', 'category': 'ui/audio', 'is_ui_object': '1'},
-        {'name': 'panel', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'rslider', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'textedit', 'category': 'ui/text', 'is_ui_object': '1'},
-        {'name': 'waveform~', 'category': 'ui/audio', 'is_ui_object': '1'},
-        {'name': 'attrui', 'category': 'ui/attributes', 'is_ui_object': '1'},
-        {'name': 'pictslider', 'category': 'ui', 'is_ui_object': '1'},
-        {'name': 'preset', 'category': 'ui/storage', 'is_ui_object': '1'},
-
-        # Control Objects
-        {'name': 'metro', 'category': 'timing', 'is_ui_object': '0'},
-        {'name': 'counter', 'category': 'math', 'is_ui_object': '0'},
-        {'name': 'random', 'category': 'math', 'is_ui_object': '0'},
-        {'name': 'scale', 'category': 'math', 'is_ui_object': '0'},
-        {'name': 'select', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'route', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'pack', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'unpack', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'trigger', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'zl', 'category': 'list', 'is_ui_object': '0'},
-        {'name': 'coll', 'category': 'data', 'is_ui_object': '0'},
-        {'name': 'dict', 'category': 'data', 'is_ui_object': '0'},
-        {'name': 'sprintf', 'category': 'text', 'is_ui_object': '0'},
-        {'name': 'print', 'category': 'debug', 'is_ui_object': '0'},
-        {'name': 'timer', 'category': 'timing', 'is_ui_object': '0'},
-        {'name': 'delay', 'category': 'timing', 'is_ui_object': '0'},
-        {'name': 'pipe', 'category': 'timing', 'is_ui_object': '0'},
-        {'name': 'defer', 'category': 'timing', 'is_ui_object': '0'},
-        {'name': 'line', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'regexp', 'category': 'text', 'is_ui_object': '0'},
-        {'name': 'bach.score', 'category': 'music/notation', 'is_ui_object': '1'},
-        {'name': 'bach.roll', 'category': 'music/notation', 'is_ui_object': '1'},
-        {'name': 'bucket', 'category': 'data', 'is_ui_object': '0'},
-        {'name': 'buddy', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'capture', 'category': 'data', 'is_ui_object': '0'},
-        {'name': 'change', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'clocker', 'category': 'timing', 'is_ui_object': '0'},
-        {'name': 'drunk', 'category': 'math', 'is_ui_object': '0'},
-        {'name': 'filewatch', 'category': 'system', 'is_ui_object': '0'},
-        {'name': 'follow', 'category': 'timing', 'is_ui_object': '0'},
-        {'name': 'fromsymbol', 'category': 'conversion', 'is_ui_object': '0'},
-        {'name': 'funbuff', 'category': 'data', 'is_ui_object': '0'},
-        {'name': 'funnel', 'category': 'list', 'is_ui_object': '0'},
-        {'name': 'gate', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'iter', 'category': 'list', 'is_ui_object': '0'},
-        {'name': 'join', 'category': 'list', 'is_ui_object': '0'},
-        {'name': 'key', 'category': 'input', 'is_ui_object': '0'},
-        {'name': 'keyup', 'category': 'input', 'is_ui_object': '0'},
-        {'name': 'match', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'pattrstorage', 'category': 'attributes', 'is_ui_object': '0'},
-        {'name': 'prepend', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'spray', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'stripnote', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'tosymbol', 'category': 'conversion', 'is_ui_object': '0'},
-        {'name': 'uzi', 'category': 'control', 'is_ui_object': '0'},
-        {'name': 'value', 'category': 'data', 'is_ui_object': '0'},
-
-        # Jitter Objects
-        {'name': 'jit.matrix', 'category': 'jitter/data', 'is_ui_object': '0'},
-        {'name': 'jit.window', 'category': 'jitter/ui', 'is_ui_object': '1'},
-        {'name': 'jit.pwindow', 'category': 'jitter/ui', 'is_ui_object': '1'},
-        {'name': 'jit.gl.render', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.gl.mesh', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.op', 'category': 'jitter/math', 'is_ui_object': '0'},
-        {'name': 'jit.gl.videoplane', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.gl.gridshape', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.gl.shader', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.gl.texture', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.grab', 'category': 'jitter/input', 'is_ui_object': '0'},
-        {'name': 'jit.movie', 'category': 'jitter/video', 'is_ui_object': '0'},
-        {'name': 'jit.qt.movie', 'category': 'jitter/video', 'is_ui_object': '0'},
-        {'name': 'jit.noise', 'category': 'jitter/gen', 'is_ui_object': '0'},
-        {'name': 'jit.record', 'category': 'jitter/output', 'is_ui_object': '0'},
-        {'name': 'jit.qt.record', 'category': 'jitter/output', 'is_ui_object': '0'},
-        {'name': 'jit.brcosa', 'category': 'jitter/fx', 'is_ui_object': '0'},
-        {'name': 'jit.char2float', 'category': 'jitter/conversion', 'is_ui_object': '0'},
-        {'name': 'jit.concat', 'category': 'jitter/data', 'is_ui_object': '0'},
-        {'name': 'jit.dimmap', 'category': 'jitter/data', 'is_ui_object': '0'},
-        {'name': 'jit.fill', 'category': 'jitter/data', 'is_ui_object': '0'},
-        {'name': 'jit.gen', 'category': 'jitter/gen', 'is_ui_object': '0'},
-        {'name': 'jit.gl.sketch', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.gl.text2d', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.gl.text3d', 'category': 'jitter/gl', 'is_ui_object': '0'},
-        {'name': 'jit.phys.body', 'category': 'jitter/physics', 'is_ui_object': '0'},
-        {'name': 'jit.phys.world', 'category': 'jitter/physics', 'is_ui_object': '0'},
-
-        # MIDI Objects
-        {'name': 'noteout', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'notein', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'midiout', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'midiin', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'ctlin', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'ctlout', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'pgmin', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'pgmout', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'bendout', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'bendin', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'touchout', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'touchin', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'makenote', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'midiparse', 'category': 'midi', 'is_ui_object': '0'},
-        {'name': 'midiformat', 'category': 'midi', 'is_ui_object': '0'},
-
-        # Min Objects
-        {'name': 'min.buffer.loop~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.edge~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.beat.pattern', 'category': 'min/midi', 'is_ui_object': '0'},
-        {'name': 'min.note.make', 'category': 'min/midi', 'is_ui_object': '0'},
-        {'name': 'min.threadcheck', 'category': 'min/debug', 'is_ui_object': '0'},
-        {'name': 'min.buffer.index~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.environment', 'category': 'min/system', 'is_ui_object': '0'},
-        {'name': 'min.hello-world', 'category': 'min/example', 'is_ui_object': '0'},
-        {'name': 'min.jit.stencil', 'category': 'min/jitter', 'is_ui_object': '0'},
-        {'name': 'min.meter~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.phasor~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.pan~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.dict.join', 'category': 'min/data', 'is_ui_object': '0'},
-        {'name': 'min.project', 'category': 'min/system', 'is_ui_object': '0'},
-        {'name': 'min.prefs', 'category': 'min/system', 'is_ui_object': '0'},
-        {'name': 'min.remote', 'category': 'min/control', 'is_ui_object': '0'},
-        {'name': 'min.sift~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.xfade~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'min.patcher.control', 'category': 'min/control', 'is_ui_object': '0'},
-        {'name': 'min.info~', 'category': 'min/audio', 'is_ui_object': '0'},
-        {'name': 'mc.min.info~', 'category': 'min/audio', 'is_ui_object': '0'},
-    ]
-
-    # その他の必要なフィールドを追加
-    for obj in max_objects:
-        obj['description'] = f"{obj['name']} オブジェクト"
-        obj['version_compatibility'] = 'Max 8.0+'
-        obj['inlets'] = '[]'
-        obj['outlets'] = '[]'
-        obj['is_deprecated'] = '0'
-        obj['alternative'] = ''
-
-    # フィールドの順序
-    fields = ['name', 'description', 'category', 'version_compatibility',
-              'inlets', 'outlets', 'is_ui_object', 'is_deprecated', 'alternative']
-
-    # データを書き出し
+    # 名前順にソート済みの手動リストを一度に書き出し（改行はcsv.writerと同じ\r\n）
+    lines = [','.join(OBJECT_FIELDS)]
+    lines.extend(map(','.join, _MANUAL_ROWS))
     with open(OUTPUT_FILE, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-
-        # 名前でソートしてから書き出し
-        sorted_objects = sorted(max_objects, key=lambda x: x['name'])
-        for obj in sorted_objects:
-            writer.writerow(obj)
+        f.write('\r\n'.join(lines) + '\r\n')
 
-    print(f"リスト作成完了。{len(max_objects)}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
+    print(f"リスト作成完了。{len(_MANUAL_ROWS)}個のオブジェクト情報を {OUTPUT_FILE} に保存しました。")
     return OUTPUT_FILE
 
 def validate_csv(file_path):
     """CSVファイルが正しく読み込めるか検証"""
     print(f"CSVファイルを検証しています: {file_path}")
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
             reader = csv.DictReader(f)
             valid_rows = []
             for row in reader:
@@ -492,10 +629,10 @@ def validate_csv(file_path):
         return 0
 
 if __name__ == "__main__":
-    # まず元のCSVファイルの修正を試みる
+    # まず元のCSVファイルの修正を試みる（崩れた行は正規表現で復元される）
     # fixed_file = fix_maxobjects_csv()
 
-    # それでも問題がある場合は生ファイルから直接抽出を試みる
+    # ヘッダーを含めて解析できない場合は生ファイルから直接抽出を試みる
     # fixed_file = extract_objects_from_raw_files()
     # fixed_file = process_raw_files_directly()
 
@@ -3,12 +3,15 @@
 
 import os
 import csv
+import logging
 import sqlite3
 import sys
 import json
 import glob
 from pathlib import Path
 
+logger = logging.getLogger('import_data')
+
 # 基本設定
 DB_NAME = 'max_claude_kb.db'  # DB名を修正
 CSV_DIR = '../../docs'
@@ -27,16 +30,72 @@ CSV_FILES = {
     'api_mapping': os.path.join(CSV_PATH, 'API_Intent_Mapping.csv')
 }
 
+# CSVを読み込む際のバッファサイズ
+IO_BUFFER_SIZE = 1 << 20
+
+# インポート結果の要約に含めるエラーの件数
+MAX_REPORTED_ERRORS = 5
+
+# BOOLEAN列で真とみなす値と、NULLとみなす値
+_TRUTHY = frozenset(('1', 'true', 'True', 'TRUE'))
+_NULLISH = frozenset(('NULL', '', None))
+
+# 各テーブルへの挿入文（重複行はUNIQUE制約により無視される）
+_INSERT_MAX_OBJECTS = '''
+    INSERT OR IGNORE INTO max_objects (
+        name, description, category, version_compatibility,
+        inlets, outlets, is_ui_object, is_deprecated, alternative
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_MIN_DEVKIT_API = '''
+    INSERT OR IGNORE INTO min_devkit_api (
+        function_name, signature, return_type, description,
+        parameters, example_usage, version_compatibility
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_CONNECTION_PATTERNS = '''
+    INSERT OR IGNORE INTO connection_patterns (
+        source_object, source_outlet, destination_object, destination_inlet,
+        description, is_recommended, audio_signal_flow, performance_impact, compatibility_issues
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_VALIDATION_RULES = '''
+    INSERT OR IGNORE INTO validation_rules (
+        rule_type, pattern, description, severity, suggestion, example_fix, context_requirements
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_API_MAPPING = '''
+    INSERT OR IGNORE INTO api_mapping (
+        natural_language_intent, min_devkit_function_id,
+        transformation_template, context_requirements
+    ) VALUES (?, ?, ?, ?)
+'''
+
+# 一括インポート用の接続設定（このプロセスが唯一の書き込み元）
+# locking_modeはWALの共有メモリを使わないよう、journal_modeより先に設定する
+IMPORT_PRAGMAS = [
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",   # 約200MBのページキャッシュ
+    "PRAGMA mmap_size=268435456",  # 256MBまでメモリマップで読み込む
+]
+
 def create_database():
     """データベースを初期化し、スキーマを作成する"""
-    print(f"データベースを初期化: {DB_PATH}")
+    logger.info("データベースを初期化: %s", DB_PATH)
 
     # 既存のDBファイルを削除（存在する場合）
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
+    # 前回の実行で残ったWALファイルが新しいDBに適用されないよう、あわせて削除する
+    for path in (DB_PATH, DB_PATH + '-wal', DB_PATH + '-shm'):
+        if os.path.exists(path):
+            os.remove(path)
 
     # 新しいDBに接続
     conn = sqlite3.connect(DB_PATH)
+    for pragma in IMPORT_PRAGMAS:
+        conn.execute(pragma)
 
     # SQLスクリプトを読み込んで実行
     schema_path = os.path.join(SCRIPT_DIR, 'create_database.sql')
@@ -45,304 +104,348 @@ def create_database():
         conn.executescript(sql_script)
 
     conn.commit()
-    print("データベーススキーマを作成しました")
+    logger.info("データベーススキーマを作成しました")
     return conn
 
-def import_max_objects(conn, csv_path):
-    """Maxオブジェクト情報をインポート"""
-    print(f"Maxオブジェクト情報をインポート: {csv_path}")
+def read_csv_columns(f):
+    """CSVのヘッダー行を読み、列名から列位置への対応表と、残りの行のイテレータを返す"""
+    reader = csv.reader(f)
+    columns = {column: i for i, column in enumerate(next(reader, []))}
+    # DictReaderと同様に空行は読み飛ばす
+    return columns, filter(None, reader)
 
-    cursor = conn.cursor()
-    # 処理済みの名前を記録するセット
-    processed_names = set()
-    imported_count = 0
+def field(row, index, default=''):
+    """行から列位置indexの値を取り出す
+
+    列がない場合（indexが負）はdefaultを、行が短い場合はDictReaderと同様にNoneを返す
+    """
+    if index < 0:
+        return default
+    return row[index] if index < len(row) else None
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, 1):
+def _to_int(value, default=0):
+    """値を整数に変換する（変換できない場合はdefault）"""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+def insert_rows(conn, sql, rows, describe, errors):
+    """行をまとめて1つのトランザクションで挿入し、挿入した件数を返す
+
+    挿入文はINSERT OR IGNOREのため、件数は変更行数の差分で数える
+    一括挿入が制約違反で失敗した場合はロールバックし、同じ行を1行ずつ挿入し直す
+    （挿入できなかった行はerrorsに追加する）
+    """
+    changes_before = conn.total_changes
+    try:
+        conn.execute("BEGIN")
+        conn.executemany(sql, rows)
+        conn.commit()
+        return conn.total_changes - changes_before
+    except sqlite3.IntegrityError:
+        conn.rollback()
+
+    changes_before = conn.total_changes
+    conn.execute("BEGIN")
+    for row in rows:
+        try:
+            conn.execute(sql, row)
+        except sqlite3.IntegrityError as e:
+            errors.append(f"{describe(row)}: {e}")
+    conn.commit()
+    return conn.total_changes - changes_before
+
+def log_import_summary(label, imported_count, skipped_count, errors):
+    """インポート結果を要約して出力する（行ごとには出力しない）"""
+    logger.info("%d件の%sをインポートしました", imported_count, label)
+    if skipped_count:
+        logger.info("  重複または無効な行をスキップ: %d件", skipped_count)
+    if errors:
+        logger.warning("  インポートエラー: %d件 (%s)", len(errors), '; '.join(errors[:MAX_REPORTED_ERRORS]))
+
+def import_max_objects(conn, csv_path):
+    """Maxオブジェクト情報をインポート"""
+    logger.info("Maxオブジェクト情報をインポート: %s", csv_path)
+
+    # 挿入する行（UNIQUE制約の列をキーにして、最初に現れた行だけを残す）
+    rows = {}
+    skipped_count = 0
+    errors = []
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=IO_BUFFER_SIZE) as f:
+        columns, reader = read_csv_columns(f)
+        i_name = columns.get('name', -1)
+        i_description = columns.get('description', -1)
+        i_category = columns.get('category', -1)
+        i_version_compatibility = columns.get('version_compatibility', -1)
+        i_inlets = columns.get('inlets', -1)
+        i_outlets = columns.get('outlets', -1)
+        i_is_ui_object = columns.get('is_ui_object', -1)
+        i_is_deprecated = columns.get('is_deprecated', -1)
+        i_alternative = columns.get('alternative', columns.get('recommended_alternative', -1))
+
+        # 元のファイルにmin_max_versionとmax_max_versionが含まれている場合は、その範囲を互換性情報とする
+        has_version_range = 'min_max_version' in columns and 'max_max_version' in columns
+        i_min_version = columns.get('min_max_version', -1)
+        i_max_version = columns.get('max_max_version', -1)
+
+        for row in reader:
             # 重複チェック
-            name = row.get('name', '')
-            if not name or name in processed_names:
-                print(f"  重複または無効な名前をスキップ: {name}")
+            name = field(row, i_name)
+            if not name or name in rows:
+                skipped_count += 1
                 continue
 
-            processed_names.add(name)
-
             try:
                 # BOOLEAN値を適切に変換
-                is_ui_object = 1 if row.get('is_ui_object', '0') in ('1', 'true', 'True', 'TRUE') else 0
-                is_deprecated = 1 if row.get('is_deprecated', '0') in ('1', 'true', 'True', 'TRUE') else 0
+                is_ui_object = int(field(row, i_is_ui_object, '0') in _TRUTHY)
+                is_deprecated = int(field(row, i_is_deprecated, '0') in _TRUTHY)
 
                 # 互換性情報の処理
-                version_compatibility = row.get('version_compatibility', '')
-                # 元のファイルにmin_max_versionとmax_max_versionが含まれている場合の処理
-                if 'min_max_version' in row and 'max_max_version' in row:
-                    version_compatibility = f"{row.get('min_max_version', '')} - {row.get('max_max_version', '')}"
+                if has_version_range:
+                    version_compatibility = f"{field(row, i_min_version)} - {field(row, i_max_version)}"
+                else:
+                    version_compatibility = field(row, i_version_compatibility)
 
                 # 入出力情報の処理
-                inlets = row.get('inlets', '[]')
-                outlets = row.get('outlets', '[]')
+                inlets = field(row, i_inlets, '[]')
+                outlets = field(row, i_outlets, '[]')
 
                 # NULLやデフォルト値の処理
-                alternative = row.get('alternative', row.get('recommended_alternative', None))
-                if alternative in ('NULL', '', None):
+                alternative = field(row, i_alternative, None)
+                if alternative in _NULLISH:
                     alternative = None
 
-                # データ挿入（スキーマに合わせる）
-                cursor.execute('''
-                    INSERT INTO max_objects (
-                        name, description, category, version_compatibility,
-                        inlets, outlets, is_ui_object, is_deprecated, alternative
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                # 挿入する行（スキーマの列順）
+                rows[name] = (
                     name,
-                    row.get('description', ''),
-                    row.get('category', ''),
+                    field(row, i_description),
+                    field(row, i_category),
                     version_compatibility,
                     inlets,
                     outlets,
                     is_ui_object,
                     is_deprecated,
                     alternative
-                ))
-                imported_count += 1
-            except sqlite3.IntegrityError as e:
-                print(f"  インポートエラー ({name}): {e}")
-                continue
+                )
             except Exception as e:
-                print(f"  処理エラー ({name}): {e}")
+                errors.append(f"{name}: {e}")
                 continue
 
-    conn.commit()
-    print(f"{imported_count}件のMaxオブジェクト情報をインポートしました")
+    # データ挿入（スキーマに合わせる）
+    imported_count = insert_rows(conn, _INSERT_MAX_OBJECTS, rows.values(), lambda row: row[0], errors)
+    log_import_summary('Maxオブジェクト情報', imported_count, skipped_count, errors)
 
 def import_min_devkit_api(conn, csv_path):
     """MinDevKit API情報をインポート（元の大規模CSVファイル形式に合わせる）"""
-    print(f"MinDevKit API情報をインポート: {csv_path}")
-
-    cursor = conn.cursor()
-    # 処理済みの関数名を記録するセット
-    processed_functions = set()
-    imported_count = 0
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, 1):
+    logger.info("MinDevKit API情報をインポート: %s", csv_path)
+
+    # 挿入する行（UNIQUE制約の列をキーにして、最初に現れた行だけを残す）
+    rows = {}
+    skipped_count = 0
+    errors = []
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=IO_BUFFER_SIZE) as f:
+        columns, reader = read_csv_columns(f)
+        i_function_name = columns.get('function_name', -1)
+        i_signature = columns.get('signature', -1)
+        i_return_type = columns.get('return_type', -1)
+        i_description = columns.get('description', -1)
+        i_parameters = columns.get('parameters', -1)
+        i_example_usage = columns.get('example_usage', -1)
+        i_version_compatibility = columns.get('version_compatibility', -1)
+
+        # 元のファイルにmin_versionとmax_versionが含まれている場合は、その範囲を互換性情報とする
+        has_version_range = 'min_version' in columns and 'max_version' in columns
+        i_min_version = columns.get('min_version', -1)
+        i_max_version = columns.get('max_version', -1)
+
+        for row in reader:
             # 重複チェック
-            function_name = row.get('function_name', '')
-            if not function_name or function_name in processed_functions:
-                print(f"  重複または無効な関数名をスキップ: {function_name}")
-                continue
-
-            processed_functions.add(function_name)
-
-            try:
-                # 互換性情報の処理
-                version_compatibility = row.get('version_compatibility', '')
-                # 元のファイルにmin_versionとmax_versionが含まれている場合の処理
-                if 'min_version' in row and 'max_version' in row:
-                    version_compatibility = f"{row.get('min_version', '')} - {row.get('max_version', '')}"
-
-                # データ挿入（スキーマに合わせる）
-                cursor.execute('''
-                    INSERT INTO min_devkit_api (
-                        function_name, signature, return_type, description,
-                        parameters, example_usage, version_compatibility
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    function_name,
-                    row.get('signature', ''),
-                    row.get('return_type', ''),
-                    row.get('description', ''),
-                    row.get('parameters', '[]'),
-                    row.get('example_usage', ''),
-                    version_compatibility
-                ))
-                imported_count += 1
-            except sqlite3.IntegrityError as e:
-                print(f"  インポートエラー ({function_name}): {e}")
+            function_name = field(row, i_function_name)
+            if not function_name or function_name in rows:
+                skipped_count += 1
                 continue
 
-    conn.commit()
-    print(f"{imported_count}件のMinDevKit API情報をインポートしました")
+            # 互換性情報の処理
+            if has_version_range:
+                version_compatibility = f"{field(row, i_min_version)} - {field(row, i_max_version)}"
+            else:
+                version_compatibility = field(row, i_version_compatibility)
+
+            # 挿入する行（スキーマの列順）
+            rows[function_name] = (
+                function_name,
+                field(row, i_signature),
+                field(row, i_return_type),
+                field(row, i_description),
+                field(row, i_parameters, '[]'),
+                field(row, i_example_usage),
+                version_compatibility
+            )
+
+    # データ挿入（スキーマに合わせる）
+    imported_count = insert_rows(conn, _INSERT_MIN_DEVKIT_API, rows.values(), lambda row: row[0], errors)
+    log_import_summary('MinDevKit API情報', imported_count, skipped_count, errors)
 
 def import_connection_patterns(conn, csv_path):
     """接続パターン情報をインポート（ファイルが存在する場合のみ）"""
     if not os.path.exists(csv_path):
-        print(f"警告: 接続パターンファイルが見つかりません: {csv_path}")
+        logger.warning("警告: 接続パターンファイルが見つかりません: %s", csv_path)
         return
 
-    print(f"接続パターン情報をインポート: {csv_path}")
-
-    cursor = conn.cursor()
-    # 処理済みの接続パターンを記録するセット
-    processed_patterns = set()
-    imported_count = 0
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, 1):
-            try:
-                # BOOLEAN値を適切に変換
-                is_recommended = 1 if row.get('is_recommended', '0') in ('1', 'true', 'True', 'TRUE') else 0
-                audio_signal_flow = 1 if row.get('audio_signal_flow', '0') in ('1', 'true', 'True', 'TRUE') else 0
-
-                # 数値型への変換
-                try:
-                    source_outlet = int(row.get('source_outlet', 0))
-                except (ValueError, TypeError):
-                    source_outlet = 0
-
-                try:
-                    destination_inlet = int(row.get('destination_inlet', 0))
-                except (ValueError, TypeError):
-                    destination_inlet = 0
-
-                # 重複チェック用キー
-                pattern_key = (row.get('source_object', ''), source_outlet, row.get('destination_object', ''), destination_inlet)
-                if not pattern_key[0] or not pattern_key[2] or pattern_key in processed_patterns:
-                    print(f"  重複または無効な接続パターンをスキップ: {pattern_key}")
-                    continue
-
-                processed_patterns.add(pattern_key)
-
-                # データ挿入
-                cursor.execute('''
-                    INSERT INTO connection_patterns (
-                        source_object, source_outlet, destination_object, destination_inlet,
-                        description, is_recommended, audio_signal_flow, performance_impact, compatibility_issues
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    row['source_object'],
-                    source_outlet,
-                    row['destination_object'],
-                    destination_inlet,
-                    row.get('description', ''),
-                    is_recommended,
-                    audio_signal_flow,
-                    row.get('performance_impact', ''),
-                    row.get('compatibility_issues', '')
-                ))
-                imported_count += 1
-            except sqlite3.IntegrityError as e:
-                print(f"  インポートエラー ({row.get('source_object', '')}->{row.get('destination_object', '')}): {e}")
+    logger.info("接続パターン情報をインポート: %s", csv_path)
+
+    # 挿入する行（UNIQUE制約の列をキーにして、最初に現れた行だけを残す）
+    rows = {}
+    skipped_count = 0
+    errors = []
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=IO_BUFFER_SIZE) as f:
+        columns, reader = read_csv_columns(f)
+        i_source_object = columns.get('source_object', -1)
+        i_source_outlet = columns.get('source_outlet', -1)
+        i_destination_object = columns.get('destination_object', -1)
+        i_destination_inlet = columns.get('destination_inlet', -1)
+        i_description = columns.get('description', -1)
+        i_is_recommended = columns.get('is_recommended', -1)
+        i_audio_signal_flow = columns.get('audio_signal_flow', -1)
+        i_performance_impact = columns.get('performance_impact', -1)
+        i_compatibility_issues = columns.get('compatibility_issues', -1)
+
+        for row in reader:
+            # BOOLEAN値を適切に変換
+            is_recommended = int(field(row, i_is_recommended, '0') in _TRUTHY)
+            audio_signal_flow = int(field(row, i_audio_signal_flow, '0') in _TRUTHY)
+
+            # 数値型への変換
+            source_outlet = _to_int(field(row, i_source_outlet, 0))
+            destination_inlet = _to_int(field(row, i_destination_inlet, 0))
+
+            # 重複チェック用キー
+            pattern_key = (field(row, i_source_object), source_outlet, field(row, i_destination_object), destination_inlet)
+            if not pattern_key[0] or not pattern_key[2] or pattern_key in rows:
+                skipped_count += 1
                 continue
 
-    conn.commit()
-    print(f"{imported_count}件の接続パターン情報をインポートしました")
+            # 挿入する行（スキーマの列順）
+            rows[pattern_key] = (
+                pattern_key[0],
+                source_outlet,
+                pattern_key[2],
+                destination_inlet,
+                field(row, i_description),
+                is_recommended,
+                audio_signal_flow,
+                field(row, i_performance_impact),
+                field(row, i_compatibility_issues)
+            )
+
+    # データ挿入
+    imported_count = insert_rows(conn, _INSERT_CONNECTION_PATTERNS, rows.values(), lambda row: f"{row[0]}->{row[2]}", errors)
+    log_import_summary('接続パターン情報', imported_count, skipped_count, errors)
 
 def import_validation_rules(conn, csv_path):
     """検証ルール情報をインポート（ファイルが存在する場合のみ）"""
     if not os.path.exists(csv_path):
-        print(f"警告: 検証ルールファイルが見つかりません: {csv_path}")
+        logger.warning("警告: 検証ルールファイルが見つかりません: %s", csv_path)
         return
 
-    print(f"検証ルール情報をインポート: {csv_path}")
-
-    cursor = conn.cursor()
-    # 処理済みのルールパターンを記録するセット
-    processed_patterns = set()
-    imported_count = 0
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, 1):
-            try:
-                # 重複チェック用キー
-                rule_key = (row.get('rule_type', ''), row.get('pattern', ''))
-                if not rule_key[0] or not rule_key[1] or rule_key in processed_patterns:
-                    print(f"  重複または無効な検証ルールをスキップ: {rule_key}")
-                    continue
-
-                processed_patterns.add(rule_key)
-
-                # データ挿入
-                cursor.execute('''
-                    INSERT INTO validation_rules (
-                        rule_type, pattern, description, severity, suggestion, example_fix, context_requirements
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    row['rule_type'],
-                    row['pattern'],
-                    row.get('description', ''),
-                    row.get('severity', 'warning'),
-                    row.get('suggestion', ''),
-                    row.get('example_fix', ''),
-                    row.get('context_requirements', '')
-                ))
-                imported_count += 1
-            except sqlite3.IntegrityError as e:
-                print(f"  インポートエラー ({row.get('rule_type', '')}-{row.get('pattern', '')}): {e}")
+    logger.info("検証ルール情報をインポート: %s", csv_path)
+
+    # 挿入する行（UNIQUE制約の列をキーにして、最初に現れた行だけを残す）
+    rows = {}
+    skipped_count = 0
+    errors = []
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=IO_BUFFER_SIZE) as f:
+        columns, reader = read_csv_columns(f)
+        i_rule_type = columns.get('rule_type', -1)
+        i_pattern = columns.get('pattern', -1)
+        i_description = columns.get('description', -1)
+        i_severity = columns.get('severity', -1)
+        i_suggestion = columns.get('suggestion', -1)
+        i_example_fix = columns.get('example_fix', -1)
+        i_context_requirements = columns.get('context_requirements', -1)
+
+        for row in reader:
+            # 重複チェック用キー
+            rule_key = (field(row, i_rule_type), field(row, i_pattern))
+            if not rule_key[0] or not rule_key[1] or rule_key in rows:
+                skipped_count += 1
                 continue
 
-    conn.commit()
-    print(f"{imported_count}件の検証ルール情報をインポートしました")
+            # 挿入する行（スキーマの列順）
+            rows[rule_key] = (
+                rule_key[0],
+                rule_key[1],
+                field(row, i_description),
+                field(row, i_severity, 'warning'),
+                field(row, i_suggestion),
+                field(row, i_example_fix),
+                field(row, i_context_requirements)
+            )
+
+    # データ挿入
+    imported_count = insert_rows(conn, _INSERT_VALIDATION_RULES, rows.values(), lambda row: f"{row[0]}-{row[1]}", errors)
+    log_import_summary('検証ルール情報', imported_count, skipped_count, errors)
 
 def import_api_mapping(conn, csv_path):
     """API意図マッピング情報をインポート（ファイルが存在する場合のみ）"""
     if not os.path.exists(csv_path):
-        print(f"警告: API意図マッピングファイルが見つかりません: {csv_path}")
+        logger.warning("警告: API意図マッピングファイルが見つかりません: %s", csv_path)
         return
 
-    print(f"API意図マッピング情報をインポート: {csv_path}")
+    logger.info("API意図マッピング情報をインポート: %s", csv_path)
 
-    cursor = conn.cursor()
-    cursor_lookup = conn.cursor()
-    # 処理済みの意図を記録するセット
-    processed_intents = set()
-    imported_count = 0
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, 1):
-            try:
-                # 重複チェック
-                intent = row.get('natural_language_intent', '')
-                if not intent or intent in processed_intents:
-                    print(f"  重複または無効な意図をスキップ: {intent}")
-                    continue
-
-                processed_intents.add(intent)
-
-                # 関数IDを取得（関数名からの検索を試みる）
-                function_name = row.get('min_devkit_function', row.get('min_devkit_function_id', ''))
-                function_id = None
-
-                if function_name and not function_name.isdigit():
-                    # 関数名として解釈し、IDを検索
-                    cursor_lookup.execute(
-                        "SELECT id FROM min_devkit_api WHERE function_name = ?",
-                        (function_name,)
-                    )
-                    result = cursor_lookup.fetchone()
-                    if result:
-                        function_id = result[0]
-                elif function_name and function_name.isdigit():
-                    function_id = int(function_name)
-
-                # データ挿入
-                cursor.execute('''
-                    INSERT INTO api_mapping (
-                        natural_language_intent, min_devkit_function_id,
-                        transformation_template, context_requirements
-                    ) VALUES (?, ?, ?, ?)
-                ''', (
-                    intent,
-                    function_id,
-                    row.get('transformation_template', ''),
-                    row.get('context_requirements', '')
-                ))
-                imported_count += 1
-            except sqlite3.IntegrityError as e:
-                print(f"  インポートエラー ({intent}): {e}")
+    # 関数名からIDへの対応表を一度に読み込んでおく
+    function_ids = dict(conn.execute("SELECT function_name, id FROM min_devkit_api"))
+
+    # 挿入する行（UNIQUE制約の列をキーにして、最初に現れた行だけを残す）
+    rows = {}
+    skipped_count = 0
+    errors = []
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=IO_BUFFER_SIZE) as f:
+        columns, reader = read_csv_columns(f)
+        i_intent = columns.get('natural_language_intent', -1)
+        i_function = columns.get('min_devkit_function', columns.get('min_devkit_function_id', -1))
+        i_transformation_template = columns.get('transformation_template', -1)
+        i_context_requirements = columns.get('context_requirements', -1)
+
+        for row in reader:
+            # 重複チェック
+            intent = field(row, i_intent)
+            if not intent or intent in rows:
+                skipped_count += 1
                 continue
 
-    conn.commit()
-    print(f"{imported_count}件のAPI意図マッピング情報をインポートしました")
+            # 関数IDを取得（関数名からの検索を試みる）
+            function_name = field(row, i_function)
+            function_id = None
+
+            if function_name and not function_name.isdigit():
+                # 関数名として解釈し、IDを検索
+                function_id = function_ids.get(function_name)
+            elif function_name and function_name.isdigit():
+                function_id = int(function_name)
+
+            # 挿入する行（スキーマの列順）
+            rows[intent] = (
+                intent,
+                function_id,
+                field(row, i_transformation_template),
+                field(row, i_context_requirements)
+            )
+
+    # データ挿入
+    imported_count = insert_rows(conn, _INSERT_API_MAPPING, rows.values(), lambda row: row[0], errors)
+    log_import_summary('API意図マッピング情報', imported_count, skipped_count, errors)
 
 def check_database(conn):
     """データベースの内容をチェック"""
-    print("\nデータベース内容の確認:")
+    logger.info("\nデータベース内容の確認:")
 
     cursor = conn.cursor()
 
@@ -355,22 +458,24 @@ def check_database(conn):
     for table in tables:
         cursor.execute(f"SELECT COUNT(*) FROM {table}")
         count = cursor.fetchone()[0]
-        print(f"テーブル {table}: {count}行")
+        logger.info("テーブル %s: %d行", table, count)
 
-    print("\nデータベースインポート完了！")
+    logger.info("\nデータベースインポート完了！")
 
 def main():
     """メイン処理"""
     try:
+        logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
         # コマンドライン引数から接続パターンファイルを取得
         custom_connection_patterns_path = None
         if len(sys.argv) > 1:
             custom_path = sys.argv[1]
             if os.path.exists(custom_path):
                 custom_connection_patterns_path = custom_path
-                print(f"カスタム接続パターンファイルを使用: {custom_path}")
+                logger.info("カスタム接続パターンファイルを使用: %s", custom_path)
             else:
-                print(f"警告: 指定されたファイルが存在しません: {custom_path}")
+                logger.warning("警告: 指定されたファイルが存在しません: %s", custom_path)
 
         # データベース作成
         conn = create_database()
@@ -379,38 +484,39 @@ def main():
         if os.path.exists(CSV_FILES['max_objects']):
             import_max_objects(conn, CSV_FILES['max_objects'])
         else:
-            print(f"警告: ファイルが見つかりません: {CSV_FILES['max_objects']}")
+            logger.warning("警告: ファイルが見つかりません: %s", CSV_FILES['max_objects'])
 
         if os.path.exists(CSV_FILES['min_devkit_api']):
             import_min_devkit_api(conn, CSV_FILES['min_devkit_api'])
         else:
-            print(f"警告: ファイルが見つかりません: {CSV_FILES['min_devkit_api']}")
+            logger.warning("警告: ファイルが見つかりません: %s", CSV_FILES['min_devkit_api'])
 
         # カスタム接続パターンファイルパスがある場合はそれを使用、なければデフォルトを使用
         connection_patterns_path = custom_connection_patterns_path or CSV_FILES['connection_patterns']
         if os.path.exists(connection_patterns_path):
             import_connection_patterns(conn, connection_patterns_path)
         else:
-            print(f"警告: ファイルが見つかりません: {connection_patterns_path}")
+            logger.warning("警告: ファイルが見つかりません: %s", connection_patterns_path)
 
         if os.path.exists(CSV_FILES['validation_rules']):
             import_validation_rules(conn, CSV_FILES['validation_rules'])
         else:
-            print(f"警告: ファイルが見つかりません: {CSV_FILES['validation_rules']}")
+            logger.warning("警告: ファイルが見つかりません: %s", CSV_FILES['validation_rules'])
 
         if os.path.exists(CSV_FILES['api_mapping']):
             import_api_mapping(conn, CSV_FILES['api_mapping'])
         else:
-            print(f"警告: ファイルが見つかりません: {CSV_FILES['api_mapping']}")
+            logger.warning("警告: ファイルが見つかりません: %s", CSV_FILES['api_mapping'])
 
         # データベース内容を確認
         check_database(conn)
 
-        # 接続を閉じる
+        # 配布するDBが単一ファイルで完結するよう、通常のジャーナルモードに戻してから接続を閉じる
+        conn.execute("PRAGMA journal_mode=DELETE")
         conn.close()
 
     except Exception as e:
-        print(f"エラーが発生しました: {e}")
+        logger.error("エラーが発生しました: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
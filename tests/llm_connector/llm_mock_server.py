@@ -6,14 +6,33 @@ Issue 28: Claude/LLM MCPコネクタのテスト用
 """
 
 import asyncio
-import json
 import logging
 import time
 import uuid
 import websockets
 import argparse
 import random
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set
+
+# orjsonが利用可能であれば高速なシリアライザを使用
+# (テキストフレームを維持するため、送信データはstrにデコードする)
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
 
 # ロギング設定
 logging.basicConfig(
@@ -61,28 +80,93 @@ TEST_RESPONSES = {
     ]
 }
 
+# リクエストごとの検索を定数時間で行うための索引
+_MODEL_IDS = frozenset(m["id"] for m in AVAILABLE_MODELS)
+_DEFAULT_RESPONSE = TEST_RESPONSES["default"]
+
+# 内容が変わらないレスポンスは起動時に一度だけシリアライズしておく
+_MODELS_PAYLOAD = _dumps({"type": "models", "models": AVAILABLE_MODELS})
+_CANCEL_SUCCESS_PAYLOAD = _dumps({
+    "type": "cancel_success",
+    "message": "Request cancelled successfully"
+})
+
+# 遅延なしでストリーミングする際に、1フレームにまとめるチャンクの上限（UTF-8でのバイト数）
+STREAM_COALESCE_LIMIT = 4096
+
+
+@lru_cache(maxsize=128)
+def _error_payload(code: str, message: str) -> str:
+    """エラーメッセージをシリアライズする（同じエラーは再利用する）"""
+    return _dumps({
+        "type": "error",
+        "code": code,
+        "message": message
+    })
+
+def _coalesce_parts(parts: List[str], limit: int = STREAM_COALESCE_LIMIT):
+    """連続するチャンクを、合計がlimitバイトを超えない範囲で1つにつなげる
+    
+    クライアントはストリームの内容を連結して扱うため、つなげても最終的な応答は変わらない
+    （limitを超えるチャンクは単独で送る）
+    """
+    batch: List[str] = []
+    size = 0
+    for part in parts:
+        part_size = len(part.encode('utf-8'))
+        if batch and size + part_size > limit:
+            yield "".join(batch)
+            batch, size = [], 0
+        batch.append(part)
+        size += part_size
+    if batch:
+        yield "".join(batch)
+
+
 class LLMMockServer:
     """Claude Desktop APIと互換性のあるモックサーバー"""
     
-    def __init__(self, port: int = 5678):
+    def __init__(self, port: int = 5678, chunk_delay: float = 1.0,
+                 response_delay: float = 2.0, jitter: float = 0.0):
         """初期化
         
         Args:
             port: サーバーが使用するポート番号
+            chunk_delay: ストリーミング時のチャンク間の遅延（秒、0で遅延なし）
+            response_delay: 非ストリーミング時の応答までの遅延（秒、0で遅延なし）
+            jitter: 各遅延に加えるばらつきの幅（秒）
         """
         self.port = port
+        self.chunk_delay = chunk_delay
+        self.response_delay = response_delay
+        self.jitter = jitter
         self.clients = {}  # 接続クライアント
         self.active_requests = {}  # 進行中のリクエスト
+        self.client_requests: Dict[str, Set[str]] = {}  # クライアントごとの進行中リクエストID
         self.server = None
+
+        # メッセージタイプごとのハンドラ
+        self.message_handlers = {
+            "prompt": self.handle_prompt,
+            "cancel": self.handle_cancel,
+            "list_models": self.handle_list_models
+        }
         
     async def start(self):
         """サーバーを起動"""
+        # 小さなフレームが多いためpermessage-deflateは無効化し、
+        # 読み書きバッファを大きめに取ってrecv/sendの回数を減らす
         self.server = await websockets.serve(
             self.handle_client,
             "localhost",
-            self.port
+            self.port,
+            compression=None,
+            max_size=2 ** 20,
+            max_queue=256,
+            read_limit=2 ** 17,
+            write_limit=2 ** 17
         )
-        logger.info(f"LLM Mock Server running on ws://localhost:{self.port}")
+        logger.info("LLM Mock Server running on ws://localhost:%d", self.port)
     
     async def handle_client(self, websocket, path):
         """クライアント接続を処理
@@ -94,24 +178,21 @@ class LLMMockServer:
         # クライアントIDを割り当て
         client_id = str(uuid.uuid4())
         self.clients[client_id] = websocket
-        logger.info(f"Client {client_id} connected from {path}")
+        logger.info("Client %s connected from %s", client_id, path)
         
         try:
             async for message in websocket:
                 await self.handle_message(client_id, message)
         except websockets.exceptions.ConnectionClosed:
-            logger.info(f"Client {client_id} disconnected")
+            logger.info("Client %s disconnected", client_id)
         finally:
             # クライアント切断時のクリーンアップ
             if client_id in self.clients:
                 del self.clients[client_id]
                 
             # 進行中のリクエストをキャンセル
-            reqs_to_cancel = [req_id for req_id, req in self.active_requests.items() 
-                             if req["client_id"] == client_id]
-            for req_id in reqs_to_cancel:
-                if req_id in self.active_requests:
-                    del self.active_requests[req_id]
+            for req_id in self.client_requests.pop(client_id, ()):
+                del self.active_requests[req_id]
     
     async def handle_message(self, client_id: str, message: str):
         """メッセージを処理
@@ -121,24 +202,28 @@ class LLMMockServer:
             message: 受信したメッセージ
         """
         try:
-            data = json.loads(message)
-            logger.info(f"Received message from client {client_id}: {data.get('type', 'unknown')}")
+            data = _loads(message)
+            
+            # オブジェクト以外のJSONは例外経路に入る前に弾く
+            if not isinstance(data, dict):
+                await self.send_error(client_id, "invalid_request", "Message must be a JSON object")
+                return
+            
+            msg_type = data.get("type")
+            logger.info("Received message from client %s: %s", client_id, msg_type or 'unknown')
             
             # メッセージタイプに基づいて処理
-            if data.get("type") == "prompt":
-                await self.handle_prompt(client_id, data)
-            elif data.get("type") == "cancel":
-                await self.handle_cancel(client_id)
-            elif data.get("type") == "list_models":
-                await self.handle_list_models(client_id)
+            handler = self.message_handlers.get(msg_type)
+            if handler:
+                await handler(client_id, data)
             else:
                 await self.send_error(client_id, "unknown_request_type", 
-                                     f"Unknown request type: {data.get('type', 'undefined')}")
+                                     f"Unknown request type: {msg_type or 'undefined'}")
         
-        except json.JSONDecodeError:
+        except _JSONDecodeError:
             await self.send_error(client_id, "invalid_json", "Invalid JSON format")
         except Exception as e:
-            logger.error(f"Error handling message: {str(e)}", exc_info=True)
+            logger.error("Error handling message: %s", e, exc_info=True)
             await self.send_error(client_id, "server_error", f"Server error: {str(e)}")
     
     async def handle_prompt(self, client_id: str, data: Dict[str, Any]):
@@ -156,18 +241,14 @@ class LLMMockServer:
         model = data.get("model", "claude-3-sonnet-20240229")
         config = data.get("config", {})
         
-        # モデルが存在するか確認
-        model_exists = False
-        for m in AVAILABLE_MODELS:
-            if m["id"] == model:
-                model_exists = True
-                break
-        
-        if not model_exists:
+        # モデルが存在するか確認（モデルIDは文字列のみ）
+        if not isinstance(model, str) or model not in _MODEL_IDS:
             await self.send_error(client_id, "unknown_model", f"Unknown model: {model}")
             return
         
-        # リクエストを記録
+        # リクエストを記録（同じIDの古いリクエストは索引から外して置き換える）
+        self._remove_request(req_id)
+        self.client_requests.setdefault(client_id, set()).add(req_id)
         self.active_requests[req_id] = {
             "client_id": client_id,
             "prompt": prompt,
@@ -180,19 +261,21 @@ class LLMMockServer:
         stream = config.get("stream", True)
         
         # テスト用のレスポンスを準備
-        if prompt in TEST_RESPONSES:
-            response_parts = TEST_RESPONSES[prompt]
-        else:
-            response_parts = TEST_RESPONSES["default"]
+        response_parts = TEST_RESPONSES.get(prompt, _DEFAULT_RESPONSE)
         
         # ストリーミングレスポンスを送信
         if stream:
+            # チャンク間に遅延がなければ小さなチャンクをまとめ、フレーム数を減らす
+            # （キャンセルの確認はまとめたフレームごとに行う）
+            if not self.chunk_delay and not self.jitter:
+                response_parts = list(_coalesce_parts(response_parts))
+            
             for i, part in enumerate(response_parts):
                 is_final = (i == len(response_parts) - 1)
                 
                 # 途中でキャンセルされたかチェック
                 if req_id not in self.active_requests:
-                    logger.info(f"Request {req_id} was cancelled")
+                    logger.info("Request %s was cancelled", req_id)
                     return
                 
                 # レスポンスを送信
@@ -203,8 +286,8 @@ class LLMMockServer:
                     "final": is_final
                 }
                 
-                await self.clients[client_id].send(json.dumps(response))
-                await asyncio.sleep(1.0)  # 現実的な遅延をシミュレート
+                await self.clients[client_id].send(_dumps(response))
+                await self._delay(self.chunk_delay)  # 現実的な遅延をシミュレート
         else:
             # 非ストリーミングモードでは全体を一度に送信
             full_response = " ".join(response_parts)
@@ -216,22 +299,48 @@ class LLMMockServer:
             }
             
             # 少し遅延してから送信
-            await asyncio.sleep(2.0)
-            await self.clients[client_id].send(json.dumps(response))
+            await self._delay(self.response_delay)
+            await self.clients[client_id].send(_dumps(response))
         
         # リクエスト完了時にクリーンアップ
-        if req_id in self.active_requests:
-            del self.active_requests[req_id]
+        self._remove_request(req_id)
+    
+    async def _delay(self, seconds: float):
+        """指定した秒数だけ待機する（jitterが設定されていればその幅でばらつかせる）
+        
+        Args:
+            seconds: 遅延の平均秒数
+        """
+        if self.jitter:
+            seconds = random.uniform(max(0.0, seconds - self.jitter), seconds + self.jitter)
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+    
+    def _remove_request(self, req_id: str):
+        """進行中のリクエストを記録とクライアントごとの索引から取り除く
+        
+        Args:
+            req_id: リクエストID
+        """
+        req = self.active_requests.pop(req_id, None)
+        if req is None:
+            return
+        
+        req_ids = self.client_requests.get(req["client_id"])
+        if req_ids is not None:
+            req_ids.discard(req_id)
+            if not req_ids:
+                del self.client_requests[req["client_id"]]
     
-    async def handle_cancel(self, client_id: str):
+    async def handle_cancel(self, client_id: str, data: Optional[Dict[str, Any]] = None):
         """進行中のリクエストをキャンセル
         
         Args:
             client_id: クライアントID
+            data: リクエストデータ（未使用）
         """
-        # クライアントの進行中リクエストを探す
-        reqs_to_cancel = [req_id for req_id, req in self.active_requests.items() 
-                         if req["client_id"] == client_id]
+        # クライアントの進行中リクエストを取り出す
+        reqs_to_cancel = self.client_requests.pop(client_id, ())
         
         if not reqs_to_cancel:
             await self.send_error(client_id, "no_active_request", "No active request to cancel")
@@ -242,23 +351,16 @@ class LLMMockServer:
             del self.active_requests[req_id]
         
         # キャンセル成功を通知
-        response = {
-            "type": "cancel_success",
-            "message": "Request cancelled successfully"
-        }
-        await self.clients[client_id].send(json.dumps(response))
+        await self.clients[client_id].send(_CANCEL_SUCCESS_PAYLOAD)
     
-    async def handle_list_models(self, client_id: str):
+    async def handle_list_models(self, client_id: str, data: Optional[Dict[str, Any]] = None):
         """利用可能なモデル一覧を送信
         
         Args:
             client_id: クライアントID
+            data: リクエストデータ（未使用）
         """
-        response = {
-            "type": "models",
-            "models": AVAILABLE_MODELS
-        }
-        await self.clients[client_id].send(json.dumps(response))
+        await self.clients[client_id].send(_MODELS_PAYLOAD)
     
     async def send_error(self, client_id: str, code: str, message: str):
         """エラーメッセージを送信
@@ -268,13 +370,8 @@ class LLMMockServer:
             code: エラーコード
             message: エラーメッセージ
         """
-        error = {
-            "type": "error",
-            "code": code,
-            "message": message
-        }
         if client_id in self.clients:
-            await self.clients[client_id].send(json.dumps(error))
+            await self.clients[client_id].send(_error_payload(code, message))
     
     def stop(self):
         """サーバーを停止"""
@@ -287,9 +384,20 @@ async def main():
     """メイン実行関数"""
     parser = argparse.ArgumentParser(description='LLM Mock Server')
     parser.add_argument('--port', type=int, default=5678, help='Port to run the server on')
+    parser.add_argument('--chunk-delay', type=float, default=1.0,
+                        help='Seconds between streamed chunks (0 to disable)')
+    parser.add_argument('--response-delay', type=float, default=2.0,
+                        help='Seconds before a non-streaming response (0 to disable)')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='Randomize each delay uniformly by up to this many seconds')
     args = parser.parse_args()
     
-    server = LLMMockServer(port=args.port)
+    server = LLMMockServer(
+        port=args.port,
+        chunk_delay=args.chunk_delay,
+        response_delay=args.response_delay,
+        jitter=args.jitter
+    )
     await server.start()
     
     try:
@@ -302,4 +410,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloopが利用可能であればlibuvベースのイベントループを使用
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())